@@ -1,9 +1,10 @@
 """Data processor service group implementation - Using khiveMCP wrappers."""
 
-import datetime
 import json
 import re
 import sys
+import time
+from collections.abc import Callable
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -88,6 +89,317 @@ class ErrorTestSchema(BaseModel):
     )
 
 
+# --- Processing Helpers ---
+_CASE_TRANSFORMS: dict[str, Callable[[str], str]] = {
+    "upper": str.upper,
+    "lower": str.lower,
+}
+
+
+# --- Report Rendering ---
+def _render_text(
+    config: ReportFormat,
+    processed_items: list[dict[str, Any]],
+    aggregated_data: dict[str, Any],
+    timestamp: str | None,
+) -> str:
+    """Render a plain-text report."""
+    title = config.title
+    lines = [title, "=" * len(title), ""]
+    if timestamp is not None:
+        lines += (f"Generated: {timestamp}", "")
+
+    if config.include_summary and processed_items:
+        lines += ("Summary", "-------", f"Total items: {len(processed_items)}", "")
+        if aggregated_data:
+            lines.append("Aggregated Data:")
+            lines.extend(f"  {k.capitalize()}: {v}" for k, v in aggregated_data.items())
+            lines.append("")
+
+    if processed_items:
+        lines += ("Data Items", "----------", "")
+        for item in processed_items:
+            lines.append(f"Item ID: {item.get('id', 'N/A')}")
+            lines.append(f"  Value: {json.dumps(item.get('value'))}")
+            if item.get("metadata"):
+                lines.append("  Metadata:")
+                lines.extend(
+                    f"    {k}: {json.dumps(v)}" for k, v in item["metadata"].items()
+                )
+            lines.append("")  # Blank line between items
+    return "\n".join(lines)
+
+
+def _render_markdown(
+    config: ReportFormat,
+    processed_items: list[dict[str, Any]],
+    aggregated_data: dict[str, Any],
+    timestamp: str | None,
+) -> str:
+    """Render a Markdown report."""
+    lines = [f"# {config.title}", ""]
+    if timestamp is not None:
+        lines += (f"**Generated:** {timestamp}", "")
+
+    if config.include_summary and processed_items:
+        lines += ("## Summary", "", f"**Total items: {len(processed_items)}**", "")
+        if aggregated_data:
+            lines += ("### Aggregated Data", "")
+            lines.extend(
+                f"- **{k.capitalize()}:** {v}" for k, v in aggregated_data.items()
+            )
+            lines.append("")
+
+    if processed_items:
+        lines += ("## Data Items", "")
+        for item in processed_items:
+            lines.append(f"### Item ID: {item.get('id', 'N/A')}")
+            lines.append(f"- **Value:** `{json.dumps(item.get('value'))}`")
+            if item.get("metadata"):
+                lines.append("- **Metadata:**")
+                lines.extend(
+                    f"  - `{k}`: `{json.dumps(v)}`" for k, v in item["metadata"].items()
+                )
+            lines.append("")
+    return "\n".join(lines)
+
+
+def _render_html(
+    config: ReportFormat,
+    processed_items: list[dict[str, Any]],
+    aggregated_data: dict[str, Any],
+    timestamp: str | None,
+) -> str:
+    """Render an HTML report as a single document."""
+    parts = [f"<h1>{config.title}</h1>"]
+    if timestamp is not None:
+        parts.append(f"<p><strong>Generated:</strong> {timestamp}</p>")
+
+    if config.include_summary and processed_items:
+        parts.append("<h2>Summary</h2>")
+        parts.append(f"<p><strong>Total items: {len(processed_items)}</strong></p>")
+        if aggregated_data:
+            parts.append("<h3>Aggregated Data</h3><ul>")
+            parts.extend(
+                f"<li><strong>{k.capitalize()}:</strong> {v}</li>"
+                for k, v in aggregated_data.items()
+            )
+            parts.append("</ul>")
+
+    if processed_items:
+        parts.append("<h2>Data Items</h2>")
+        for item in processed_items:
+            parts.append(
+                "<div style='border:1px solid #ccc; margin-bottom:10px; padding:10px;'>"
+            )
+            parts.append(f"<h3>Item ID: {item.get('id', 'N/A')}</h3>")
+            parts.append(
+                f"<p><strong>Value:</strong> <code>{json.dumps(item.get('value'))}</code></p>"
+            )
+            if item.get("metadata"):
+                parts.append("<p><strong>Metadata:</strong></p><ul>")
+                parts.extend(
+                    f"<li><code>{k}</code>: <code>{json.dumps(v)}</code></li>"
+                    for k, v in item["metadata"].items()
+                )
+                parts.append("</ul>")
+            parts.append("</div>")
+    return f"<!DOCTYPE html><html><head><title>{config.title}</title></head><body>{''.join(parts)}</body></html>"
+
+
+_REPORT_RENDERERS: dict[str, Callable[..., str]] = {
+    "text": _render_text,
+    "markdown": _render_markdown,
+    "html": _render_html,
+}
+
+
+# --- Schema Validation Plans ---
+# Plans collect errors as (path, message) pairs; ValidationError models are only
+# built once, for the final result.
+_SchemaPlan = Callable[[Any, str, list[tuple[str, str]]], None]
+
+_SCHEMA_TYPES: dict[str, type | tuple[type, ...]] = {
+    "object": dict,
+    "array": list,
+    "string": str,
+    "number": (int, float),
+    "integer": int,
+    "boolean": bool,
+    "null": type(None),
+}
+
+
+_PLAN_CACHE_SIZE = 256
+_PLAN_CACHE: dict[str, _SchemaPlan] = {}
+
+
+def _get_schema_plan(schema: SchemaDefinition) -> _SchemaPlan:
+    """Return the compiled validation plan for a schema definition."""
+    # stdlib json keeps Infinity/NaN, so bounds survive in the cache key
+    key = json.dumps(schema.model_dump(), sort_keys=True)
+    plan = _PLAN_CACHE.get(key)
+    if plan is None:
+        if len(_PLAN_CACHE) >= _PLAN_CACHE_SIZE:
+            _PLAN_CACHE.clear()
+        plan = _PLAN_CACHE[key] = _build_plan(schema)
+    return plan
+
+
+def _build_plan(schema: SchemaDefinition) -> _SchemaPlan:
+    """Compile a schema definition into a single validation closure.
+
+    Nested schemas are parsed and compiled once, up front, so validating data
+    walks prebuilt closures instead of rebuilding ``SchemaDefinition`` models
+    at every node. Invalid nested schemas are still only reported when the
+    data actually reaches them.
+    """
+    schema_type = schema.type.lower()
+    expected_type = _SCHEMA_TYPES.get(schema_type)
+    checks: list[_SchemaPlan] = []
+
+    if schema_type == "object":
+        if schema.required:
+            required = tuple(sys.intern(name) for name in schema.required)
+
+            def check_required(data, path, errors):
+                for req_prop in required:
+                    if req_prop not in data:
+                        errors.append(
+                            (path or "$", f"Required property '{req_prop}' missing")
+                        )
+
+            checks.append(check_required)
+        if schema.properties:
+            properties = tuple(
+                (
+                    sys.intern(prop_name),
+                    _build_property_plan(prop_name, prop_schema_dict),
+                )
+                for prop_name, prop_schema_dict in schema.properties.items()
+            )
+
+            def check_properties(data, path, errors):
+                for prop_name, prop_plan in properties:
+                    if prop_name in data:
+                        prop_path = f"{path}.{prop_name}" if path else prop_name
+                        try:
+                            prop_plan(data[prop_name], prop_path, errors)
+                        except Exception as e:
+                            errors.append(
+                                (
+                                    prop_path,
+                                    f"Error validating property '{prop_name}': {e}",
+                                )
+                            )
+
+            checks.append(check_properties)
+
+    elif schema_type == "array" and schema.items:
+        try:
+            item_plan = _build_plan(SchemaDefinition(**schema.items))
+        except Exception as e:
+            message = f"Error validating array items: {e}"
+
+            def check_items(data, path, errors):
+                errors.append((path or "$", message))
+
+        else:
+
+            def check_items(data, path, errors):
+                try:
+                    for i, item in enumerate(data):
+                        item_plan(item, f"{path}[{i}]", errors)
+                except Exception as e:
+                    errors.append((path or "$", f"Error validating array items: {e}"))
+
+        checks.append(check_items)
+
+    elif schema_type == "string":
+        if schema.pattern:
+            pattern = schema.pattern
+            pattern_message = f"Value does not match pattern: {pattern}"
+            try:
+                compiled_pattern = re.compile(pattern)
+            except re.error as e:
+                # Log regex error once, but treat every value as a non-match
+                print(
+                    f"[Warning] Invalid regex pattern '{pattern}' in schema: {e}",
+                    file=sys.stderr,
+                )
+
+                def check_pattern(data, path, errors):
+                    errors.append((path or "$", pattern_message))
+
+            else:
+
+                def check_pattern(data, path, errors):
+                    # fullmatch: the whole string must match the pattern
+                    if compiled_pattern.fullmatch(data) is None:
+                        errors.append((path or "$", pattern_message))
+
+            checks.append(check_pattern)
+        # Basic email format check
+        if schema.format == "email":
+
+            def check_email(data, path, errors):
+                if "@" not in data or "." not in data.split("@")[-1]:
+                    errors.append((path or "$", "Invalid email format"))
+
+            checks.append(check_email)
+        # Add other format checks if needed (date-time, etc.)
+
+    elif schema_type in ("number", "integer"):
+        minimum, maximum = schema.minimum, schema.maximum
+        if minimum is not None:
+
+            def check_minimum(data, path, errors):
+                if data < minimum:
+                    errors.append(
+                        (path or "$", f"Value {data} is less than minimum {minimum}")
+                    )
+
+            checks.append(check_minimum)
+        if maximum is not None:
+
+            def check_maximum(data, path, errors):
+                if data > maximum:
+                    errors.append(
+                        (path or "$", f"Value {data} is greater than maximum {maximum}")
+                    )
+
+            checks.append(check_maximum)
+
+    def plan(data, path, errors):
+        if expected_type is None or not isinstance(data, expected_type):
+            errors.append(
+                (
+                    path or "$",
+                    f"Expected type '{schema_type}', got {type(data).__name__}",
+                )
+            )
+            return  # Stop validation for this path if type is wrong
+        for check in checks:
+            check(data, path, errors)
+
+    return plan
+
+
+def _build_property_plan(
+    prop_name: str, prop_schema_dict: dict[str, Any]
+) -> _SchemaPlan:
+    """Compile a property schema, deferring definition errors to validation time."""
+    try:
+        return _build_plan(SchemaDefinition(**prop_schema_dict))
+    except Exception as e:
+        message = f"Error validating property '{prop_name}': {e}"
+
+        def report_invalid_schema(data, path, errors):
+            errors.append((path, message))
+
+        return report_invalid_schema
+
+
 # --- Service Group Class ---
 class DataProcessorGroup(ServiceGroup):
     """Service group using khiveMCP decorators and context."""
@@ -118,16 +430,30 @@ class DataProcessorGroup(ServiceGroup):
             # For now, returning an empty dict with error info might be one way
             return {"error": f"Exceeded max items limit ({max_items})"}
 
-        for i, item in enumerate(request.data):
-            try:
-                processed_item = self._process_item(item, request.parameters)
-                processed_items.append(processed_item)
-            except Exception as e:
-                pass
-            if (
-                i + 1
-            ) % 10 == 0 or i == total_items - 1:  # Update progress periodically
-                pass
+        params = request.parameters
+        case_op = (
+            _CASE_TRANSFORMS.get(params.transform_case.lower())
+            if params.transform_case
+            else None
+        )
+        filter_set = frozenset(params.filter_fields or ())
+        if case_op is None and not filter_set:
+            # Identity transform: copy items through without per-item processing
+            processed_items = [
+                (
+                    {"id": item.id, "value": item.value, "metadata": item.metadata}
+                    if item.metadata
+                    else {"id": item.id, "value": item.value}
+                )
+                for item in request.data
+            ]
+        else:
+            for item in request.data:
+                try:
+                    processed_item = self._process_item(item, case_op, filter_set)
+                    processed_items.append(processed_item)
+                except Exception as e:
+                    pass
 
         result = {"processed_items": processed_items}
         if request.parameters.aggregate:
@@ -146,108 +472,18 @@ class DataProcessorGroup(ServiceGroup):
         report_format_config = request.format
         format_type = report_format_config.format_type.lower()
         default_format = self.group_config.get("default_report_format", "text")
-        if format_type not in ["text", "markdown", "html"]:
+        if format_type not in _REPORT_RENDERERS:
             format_type = default_format
 
         processed_items = request.processed_data.get("processed_items", [])
         aggregated_data = request.processed_data.get("aggregated", {})
-        report_lines = []
-
-        # 1. Title
-        title = report_format_config.title
-        if format_type == "markdown":
-            report_lines.extend([f"# {title}", ""])
-        elif format_type == "html":
-            report_lines.append(f"<h1>{title}</h1>")
-        else:
-            report_lines.extend([title, "=" * len(title), ""])
-
-        # 2. Timestamp
-        if report_format_config.include_timestamp:
-            ts = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC")
-            if format_type == "markdown":
-                report_lines.extend([f"**Generated:** {ts}", ""])
-            elif format_type == "html":
-                report_lines.append(f"<p><strong>Generated:</strong> {ts}</p>")
-            else:
-                report_lines.extend([f"Generated: {ts}", ""])
-
-        # 3. Summary
-        if report_format_config.include_summary and processed_items:
-            total_items_str = f"Total items: {len(processed_items)}"
-            if format_type == "markdown":
-                report_lines.extend(["## Summary", "", f"**{total_items_str}**", ""])
-                if aggregated_data:
-                    report_lines.extend(["### Aggregated Data", ""])
-                    for k, v in aggregated_data.items():
-                        report_lines.append(f"- **{k.capitalize()}:** {v}")
-                    report_lines.append("")
-            elif format_type == "html":
-                report_lines.append("<h2>Summary</h2>")
-                report_lines.append(f"<p><strong>{total_items_str}</strong></p>")
-                if aggregated_data:
-                    report_lines.append("<h3>Aggregated Data</h3><ul>")
-                    for k, v in aggregated_data.items():
-                        report_lines.append(
-                            f"<li><strong>{k.capitalize()}:</strong> {v}</li>"
-                        )
-                    report_lines.append("</ul>")
-            else:  # text
-                report_lines.extend(["Summary", "-------", total_items_str, ""])
-                if aggregated_data:
-                    report_lines.append("Aggregated Data:")
-                    for k, v in aggregated_data.items():
-                        report_lines.append(f"  {k.capitalize()}: {v}")
-                    report_lines.append("")
-
-        # 4. Data Items
-        if processed_items:
-            if format_type == "markdown":
-                report_lines.extend(["## Data Items", ""])
-                for item in processed_items:
-                    report_lines.append(f"### Item ID: {item.get('id', 'N/A')}")
-                    report_lines.append(
-                        f"- **Value:** `{json.dumps(item.get('value'))}`"
-                    )
-                    if item.get("metadata"):
-                        report_lines.append("- **Metadata:**")
-                        for k, v in item["metadata"].items():
-                            report_lines.append(f"  - `{k}`: `{json.dumps(v)}`")
-                    report_lines.append("")
-            elif format_type == "html":
-                report_lines.append("<h2>Data Items</h2>")
-                for item in processed_items:
-                    report_lines.append(
-                        "<div style='border:1px solid #ccc; margin-bottom:10px; padding:10px;'>"
-                    )
-                    report_lines.append(f"<h3>Item ID: {item.get('id', 'N/A')}</h3>")
-                    report_lines.append(
-                        f"<p><strong>Value:</strong> <code>{json.dumps(item.get('value'))}</code></p>"
-                    )
-                    if item.get("metadata"):
-                        report_lines.append("<p><strong>Metadata:</strong></p><ul>")
-                        for k, v in item["metadata"].items():
-                            report_lines.append(
-                                f"<li><code>{k}</code>: <code>{json.dumps(v)}</code></li>"
-                            )
-                        report_lines.append("</ul>")
-                    report_lines.append("</div>")
-            else:  # text
-                report_lines.extend(["Data Items", "----------", ""])
-                for item in processed_items:
-                    report_lines.append(f"Item ID: {item.get('id', 'N/A')}")
-                    report_lines.append(f"  Value: {json.dumps(item.get('value'))}")
-                    if item.get("metadata"):
-                        report_lines.append("  Metadata:")
-                        for k, v in item["metadata"].items():
-                            report_lines.append(f"    {k}: {json.dumps(v)}")
-                    report_lines.append("")  # Blank line between items
-        separator = "\n"
-        # HTML needs careful joining, maybe wrap in basic HTML structure?
-        if format_type == "html":
-            return f"<!DOCTYPE html><html><head><title>{report_format_config.title}</title></head><body>{''.join(report_lines)}</body></html>"
-
-        return separator.join(report_lines)
+        timestamp = (
+            time.strftime("%Y-%m-%d %H:%M:%S UTC")
+            if report_format_config.include_timestamp
+            else None
+        )
+        render = _REPORT_RENDERERS.get(format_type, _render_text)
+        return render(report_format_config, processed_items, aggregated_data, timestamp)
 
     @operation(
         name="validate_schema",
@@ -259,22 +495,19 @@ class DataProcessorGroup(ServiceGroup):
     ) -> ValidationResult:
         """Validate input data against a specified schema."""
 
-        errors: list[ValidationError] = []
-        valid = False
+        errors: list[tuple[str, str]] = []
         try:
-            self._validate_data_against_schema(
-                request.data, request.schema_def, "", errors
-            )
-            valid = len(errors) == 0
+            plan = _get_schema_plan(request.schema_def)
+            plan(request.data, "", errors)
         except Exception as e:
-            errors.append(
-                ValidationError(
-                    path="", message=f"Internal validation error: {type(e).__name__}"
-                )
-            )
-            valid = False
+            errors.append(("", f"Internal validation error: {type(e).__name__}"))
 
-        return ValidationResult(valid=valid, errors=errors if errors else None)
+        if not errors:
+            return ValidationResult(valid=True)
+        return ValidationResult(
+            valid=False,
+            errors=[ValidationError(path=path, message=msg) for path, msg in errors],
+        )
 
     @operation(
         name="test_error",
@@ -323,24 +556,26 @@ class DataProcessorGroup(ServiceGroup):
 
     # --- Helper Methods (Keep as they were, ensure they are correct) ---
     def _process_item(
-        self, item: DataItem, params: ProcessingParameters
+        self,
+        item: DataItem,
+        case_op: Callable[[str], str] | None,
+        filter_set: frozenset[str],
     ) -> dict[str, Any]:
-        """Process a single data item."""
+        """Process a single data item.
+
+        ``case_op`` and ``filter_set`` are resolved once per request from
+        ``transform_case`` and ``filter_fields`` by the caller.
+        """
         processed = {"id": item.id}
         value = item.value
-        if isinstance(value, str) and params.transform_case:
-            case = params.transform_case.lower()
-            value = (
-                value.upper()
-                if case == "upper"
-                else (value.lower() if case == "lower" else value)
-            )
+        if case_op is not None and isinstance(value, str):
+            value = case_op(value)
         processed["value"] = value
 
         if item.metadata:
-            if params.filter_fields:
+            if filter_set:
                 processed["metadata"] = {
-                    k: v for k, v in item.metadata.items() if k in params.filter_fields
+                    k: v for k, v in item.metadata.items() if k in filter_set
                 }
             else:
                 processed["metadata"] = item.metadata
@@ -364,157 +599,3 @@ class DataProcessorGroup(ServiceGroup):
             "min": min(numeric_values),
             "max": max(numeric_values),
         }
-
-    def _validate_data_against_schema(
-        self,
-        data: Any,
-        schema: SchemaDefinition,
-        path: str,
-        errors: list[ValidationError],
-    ) -> None:
-        """Recursively validate data against a schema definition."""
-        schema_type = schema.type.lower()
-
-        # Type checking
-        type_valid = False
-        expected_type_msg = schema_type
-        current_type_name = type(data).__name__
-
-        if (
-            schema_type == "object"
-            and isinstance(data, dict)
-            or schema_type == "array"
-            and isinstance(data, list)
-            or schema_type == "string"
-            and isinstance(data, str)
-            or schema_type == "number"
-            and isinstance(data, (int, float))
-            or schema_type == "integer"
-            and isinstance(data, int)
-            or schema_type == "boolean"
-            and isinstance(data, bool)
-            or schema_type == "null"
-            and data is None
-        ):
-            type_valid = True
-
-        if not type_valid:
-            errors.append(
-                ValidationError(
-                    path=path or "$",
-                    message=f"Expected type '{expected_type_msg}', got {current_type_name}",
-                )
-            )
-            return  # Stop validation for this path if type is wrong
-
-        # Further validation based on type
-        if schema_type == "object":
-            if schema.required:
-                for req_prop in schema.required:
-                    if req_prop not in data:
-                        errors.append(
-                            ValidationError(
-                                path=path or "$",
-                                message=f"Required property '{req_prop}' missing",
-                            )
-                        )
-            if schema.properties:
-                for prop_name, prop_schema_dict in schema.properties.items():
-                    if prop_name in data:
-                        prop_path = f"{path}.{prop_name}" if path else prop_name
-                        try:
-                            prop_schema = SchemaDefinition(**prop_schema_dict)
-                            self._validate_data_against_schema(
-                                data[prop_name], prop_schema, prop_path, errors
-                            )
-                        except ValidationError as e_pydantic:
-                            errors.append(
-                                ValidationError(
-                                    path=prop_path,
-                                    message=f"Invalid property schema definition for '{prop_name}': {e_pydantic}",
-                                )
-                            )
-                        except Exception as e:
-                            errors.append(
-                                ValidationError(
-                                    path=prop_path,
-                                    message=f"Error validating property '{prop_name}': {e}",
-                                )
-                            )
-
-        elif schema_type == "array" and schema.items:
-            try:
-                item_schema = SchemaDefinition(**schema.items)
-                for i, item in enumerate(data):
-                    item_path = f"{path}[{i}]"
-                    self._validate_data_against_schema(
-                        item, item_schema, item_path, errors
-                    )
-            except ValidationError as e_pydantic:
-                errors.append(
-                    ValidationError(
-                        path=path or "$",
-                        message=f"Invalid array items schema definition: {e_pydantic}",
-                    )
-                )
-            except Exception as e:
-                errors.append(
-                    ValidationError(
-                        path=path or "$", message=f"Error validating array items: {e}"
-                    )
-                )
-
-        elif schema_type == "string":
-            if schema.pattern and not self._matches_pattern(data, schema.pattern):
-                errors.append(
-                    ValidationError(
-                        path=path or "$",
-                        message=f"Value does not match pattern: {schema.pattern}",
-                    )
-                )
-            # Basic email format check
-            if schema.format == "email":
-                if (
-                    not isinstance(data, str)
-                    or "@" not in data
-                    or "." not in data.split("@")[-1]
-                ):
-                    errors.append(
-                        ValidationError(
-                            path=path or "$", message="Invalid email format"
-                        )
-                    )
-            # Add other format checks if needed (date-time, etc.)
-
-        elif schema_type in ["number", "integer"]:
-            # Ensure data is numeric (already checked by type_valid)
-            num_data = data
-            if schema.minimum is not None and num_data < schema.minimum:
-                errors.append(
-                    ValidationError(
-                        path=path or "$",
-                        message=f"Value {num_data} is less than minimum {schema.minimum}",
-                    )
-                )
-            if schema.maximum is not None and num_data > schema.maximum:
-                errors.append(
-                    ValidationError(
-                        path=path or "$",
-                        message=f"Value {num_data} is greater than maximum {schema.maximum}",
-                    )
-                )
-
-    def _matches_pattern(self, data: str, pattern: str) -> bool:
-        """Simple regex pattern matching."""
-        if not isinstance(data, str):  # Should not happen if type validation runs first
-            return False
-        try:
-            # Use re.fullmatch for complete string matching against pattern
-            return bool(re.fullmatch(pattern, data))
-        except re.error as e:
-            # Log regex error, but treat as non-match for validation purposes
-            print(
-                f"[Warning] Invalid regex pattern '{pattern}' encountered during validation: {e}",
-                file=sys.stderr,
-            )
-            return False
@@ -2,6 +2,7 @@
 
 import inspect
 import logging
+import sys
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from typing import Any
@@ -24,6 +25,11 @@ class ToolSpec:
     auth_required: list[str] | None = None
     rate_limited: bool = False
 
+    def __post_init__(self) -> None:
+        # Scope names are compared on every authorized call; intern them once.
+        if self.auth_required:
+            self.auth_required = [sys.intern(s) for s in self.auth_required]
+
 
 def collect_tools_from_groups(instantiated_groups) -> list[ToolSpec]:
     """Collect all tools from instantiated groups without registering them.
@@ -1,6 +1,7 @@
 """Tool wrapper creation and registration for FastMCP."""
 
 import logging
+from functools import lru_cache
 from typing import Any
 
 from fastmcp import FastMCP
@@ -13,6 +14,48 @@ from .tool_spec import ToolSpec
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _get_adapter(schema_cls: type) -> TypeAdapter:
+    """Return the shared TypeAdapter for a schema class.
+
+    Building a TypeAdapter compiles the core schema, so wrappers created for
+    the same schema class reuse a single adapter.
+    """
+    return TypeAdapter(schema_cls)
+
+
+def _validate_request(adapter: TypeAdapter, payload: Any) -> Any:
+    """Validate a request payload (dict, model, or raw JSON) with an adapter.
+
+    Raises:
+        pydantic.ValidationError: If the payload does not match the schema.
+            It subclasses ValueError, so existing ValueError handlers still
+            apply.
+    """
+    # Raw JSON is parsed and validated in a single pydantic-core pass
+    if isinstance(payload, (str, bytes, bytearray)):
+        return adapter.validate_json(payload)
+    return adapter.validate_python(payload)
+
+
+def _check_authz(
+    ctx: Context | None, required_scopes: frozenset[str], tool_name: str
+) -> None:
+    """Check that the caller's token carries the required scopes."""
+    # Try common Context shapes without hard-coding FastMCP internals.
+    # A missing ctx (None) has neither attribute and falls through below.
+    token = getattr(ctx, "access_token", None) or getattr(ctx, "token", None)
+    if token is None:
+        raise PermissionError(f"Authentication required for tool '{tool_name}'")
+
+    # Check if token has required scopes
+    missing = required_scopes.difference(getattr(token, "scopes", None) or ())
+    if missing:
+        raise PermissionError(
+            f"Missing required scopes for tool '{tool_name}': {sorted(missing)}"
+        )
+
+
 def create_tool_wrapper(spec: ToolSpec):
     """Create a wrapper function compatible with FastMCP tool registration.
 
@@ -28,65 +71,58 @@ def create_tool_wrapper(spec: ToolSpec):
     bound_method = spec.bound_method
     schema_cls = spec.schema_cls
     accepts_ctx = spec.accepts_ctx
+    tool_name = spec.full_tool_name
 
-    # Cache TypeAdapter for better performance
-    adapter = TypeAdapter(schema_cls) if schema_cls else None
+    adapter = _get_adapter(schema_cls) if schema_cls else None
+    # Required scopes are fixed per tool, so build the set once
+    required_scopes = frozenset(spec.auth_required or ())
 
-    async def _coerce_request(payload):
-        """Convert various request formats to the expected schema."""
-        if adapter is None:
+    if adapter is None:
+
+        def _coerce_request(payload):
+            """Pass the request through unchanged for schema-less tools."""
             return payload
 
-        try:
-            if isinstance(payload, str):
-                return adapter.validate_json(payload)
-            else:
-                return adapter.validate_python(payload)
-        except Exception as e:
-            logger.error(f"Request validation failed for {spec.full_tool_name}: {e}")
-            raise ValueError(f"Invalid request format: {e}")
-
-    async def _check_authz(ctx: Context | None):
-        """Check authorization if required for this tool."""
-        if not spec.auth_required:
-            return  # No auth required
-
-        if ctx is None:
-            raise PermissionError(
-                f"Authentication required for tool '{spec.full_tool_name}'"
-            )
-
-        # Try common Context shapes without hard-coding FastMCP internals
-        token = getattr(ctx, "access_token", None) or getattr(ctx, "token", None)
-        if token is None:
-            raise PermissionError(
-                f"Authentication required for tool '{spec.full_tool_name}'"
-            )
-
-        # Check if token has required scopes
-        token_scopes = set(getattr(token, "scopes", []) or [])
-        required_scopes = set(spec.auth_required)
-
-        if not required_scopes.issubset(token_scopes):
-            missing = sorted(required_scopes - token_scopes)
-            raise PermissionError(
-                f"Missing required scopes for tool '{spec.full_tool_name}': {missing}"
-            )
+    else:
+
+        def _coerce_request(payload):
+            """Convert various request formats to the expected schema."""
+            return _validate_request(adapter, payload)
 
     # Strategy: If auth is required, always request Context so we can authorize,
     # even if the underlying method doesn't accept ctx.
     # Otherwise mirror the method's declared context usage.
-    if spec.auth_required or accepts_ctx:
+    # Each combination gets its own closure so the per-call path has no
+    # feature checks left in it.
+    if spec.auth_required and accepts_ctx:
+
+        async def tool_with_context(ctx: Context, request: dict | str | Any):
+            _check_authz(ctx, required_scopes, tool_name)
+            return await bound_method(ctx=ctx, request=_coerce_request(request))
+
+    elif spec.auth_required:
+
+        async def tool_with_context(ctx: Context, request: dict | str | Any):
+            _check_authz(ctx, required_scopes, tool_name)
+            # Underlying method does not accept ctx
+            return await bound_method(request=_coerce_request(request))
+
+    elif accepts_ctx:
 
         async def tool_with_context(ctx: Context, request: dict | str | Any):
-            await _check_authz(ctx)
-            coerced_request = await _coerce_request(request)
-            if accepts_ctx:
-                return await bound_method(ctx=ctx, request=coerced_request)
-            else:
-                # Underlying method does not accept ctx
-                return await bound_method(request=coerced_request)
+            return await bound_method(ctx=ctx, request=_coerce_request(request))
+
+    elif adapter is None:
+        # No schema: forward the request straight to the method
+        async def tool_without_context(request: dict | str | Any):
+            return await bound_method(request=request)
 
+    else:
+        # Standard method without context
+        async def tool_without_context(request: dict | str | Any):
+            return await bound_method(request=_coerce_request(request))
+
+    if spec.auth_required or accepts_ctx:
         tool_with_context.__annotations__ = {
             "ctx": Context,
             "request": dict,
@@ -94,12 +130,6 @@ def create_tool_wrapper(spec: ToolSpec):
         }
         wrapper = tool_with_context
     else:
-        # Standard method without context
-        async def tool_without_context(request: dict | str | Any):
-            # No auth required here; if required, we used tool_with_context above
-            coerced_request = await _coerce_request(request)
-            return await bound_method(request=coerced_request)
-
         tool_without_context.__annotations__ = {"request": dict, "return": Any}
         wrapper = tool_without_context
 
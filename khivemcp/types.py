@@ -1,6 +1,7 @@
 """Core configuration data models for khivemcp."""
 
 import asyncio
+import re
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field, field_validator
@@ -9,6 +10,10 @@ if TYPE_CHECKING:
     from fastmcp.server.auth import AuthProvider
 
 
+# 'dotted.module.path:ClassName', compiled once for GroupConfig validation
+_CLASS_PATH_RE = re.compile(r"[A-Za-z_]\w*(?:\.[A-Za-z_]\w*)*:[A-Za-z_]\w*")
+
+
 class DependencyStatus(BaseModel):
     """Status of a single dependency."""
 
@@ -126,7 +131,7 @@ class GroupConfig(BaseModel):
 
     @field_validator("class_path")
     def check_class_path_format(cls, v):
-        if ":" not in v or v.startswith(".") or ":" not in v.split(".")[-1]:
+        if not _CLASS_PATH_RE.fullmatch(v):
             raise ValueError("class_path must be in the format 'module.path:ClassName'")
         return v
 
@@ -11,6 +11,9 @@ from .types import GroupConfig, ServiceConfig
 
 logger = logging.getLogger(__name__)
 
+# Use the libyaml-backed safe loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def load_config(path: Path) -> ServiceConfig | GroupConfig:
     """Load and validate configuration from a YAML or JSON file.
@@ -38,7 +41,7 @@ def load_config(path: Path) -> ServiceConfig | GroupConfig:
     try:
         data: dict
         if path.suffix.lower() in [".yaml", ".yml"]:
-            data = yaml.safe_load(file_content)
+            data = yaml.load(file_content, Loader=_YAML_LOADER)
             if not isinstance(data, dict):
                 raise ValueError("YAML content does not resolve to a dictionary.")
             logger.debug(f"Parsed YAML content from '{path.name}'")
@@ -1,4 +1,5 @@
 # verify_client.py
+import json
 import sys
 
 import anyio
@@ -6,6 +7,41 @@ import mcp.types as types  # For result type checking if needed
 from mcp.client.session import ClientSession
 from mcp.client.stdio import StdioServerParameters, stdio_client
 
+REQUIRED_TOOLS = frozenset(
+    {
+        "data-processor.process_data",
+        "data-processor.generate_report",
+        "data-processor.validate_schema",
+        "data-processor.test_error",
+    }
+)
+
+# For AutoMCP operations, FastMCP expects the first parameter to be ctx (which it
+# handles); we only pass the remaining parameters, keyed by the method's names.
+PROCESS_DATA_ARGS = {"data": {"data": [{"id": "t1", "value": "hello"}]}}
+
+# validate_schema takes a single request parameter.
+VALIDATE_SCHEMA_ARGS = {
+    "request": {
+        "data": {"name": "test", "value": 123},
+        "schema": {  # Corresponds to schema_def in Pydantic model
+            "type": "object",
+            "properties": {
+                "name": {"type": "string"},
+                "value": {"type": "integer", "minimum": 100},
+            },
+            "required": ["name", "value"],
+        },
+    }
+}
+
+# Missing the required 'data' parameter, so FastMCP reports a validation error.
+INVALID_PROCESS_DATA_ARGS = {"parameters": {}}
+
+CONTEXT_PROCESS_DATA_ARGS = {"data": {"data": [{"id": "ctx_test", "value": 1}]}}
+
+TEST_ERROR_ARGS = {"request": {"error_type": "value_error"}}
+
 
 async def run_test(server_cmd: list[str]):
     print("\n--- Starting Test Run ---")
@@ -49,13 +85,11 @@ async def run_test(server_cmd: list[str]):
 async def test_tool_list(session: ClientSession):
     print("\nClient: Listing tools...")
     list_result = await session.list_tools()
-    tool_names = [t.name for t in list_result.tools]
-    print(f"Client: Found tools: {tool_names}")
+    tool_names = frozenset(t.name for t in list_result.tools)
+    print(f"Client: Found tools: {sorted(tool_names)}")
     # Basic check: Ensure expected tools are present (adapt based on config used)
-    assert "data-processor.process_data" in tool_names
-    assert "data-processor.generate_report" in tool_names
-    assert "data-processor.validate_schema" in tool_names
-    assert "data-processor.test_error" in tool_names  # Check our new operation
+    missing = REQUIRED_TOOLS.difference(tool_names)
+    assert not missing, f"Missing required tools: {', '.join(sorted(missing))}"
     print("Client: [PASS] Tool list looks reasonable.")
 
 
@@ -63,17 +97,10 @@ async def test_tool_calls_valid(session: ClientSession):
     print("\nClient: Testing valid tool calls...")
 
     # Test process_data
-    # For AutoMCP operations, FastMCP expects the first parameter to be ctx (which it handles)
-    # We only need to pass the remaining parameters
-    data_obj = {"data": [{"id": "t1", "value": "hello"}]}
-    process_args = {
-        "data": data_obj
-    }  # Match the parameter name in the method signature
-
-    print(f"Client: Calling data-processor.process_data with args: {process_args}")
+    print(f"Client: Calling data-processor.process_data with args: {PROCESS_DATA_ARGS}")
     try:
         process_resp = await session.call_tool(
-            "data-processor.process_data", arguments=process_args
+            "data-processor.process_data", arguments=PROCESS_DATA_ARGS
         )
         print(f"Client: process_data response: {process_resp.content}")
         assert not process_resp.isError, "Call returned an error"
@@ -89,30 +116,16 @@ async def test_tool_calls_valid(session: ClientSession):
         raise
 
     # Example for validate_schema
-    # For this operation, we need to pass a request parameter
-    request_obj = {
-        "data": {"name": "test", "value": 123},
-        "schema": {  # Corresponds to schema_def in Pydantic model
-            "type": "object",
-            "properties": {
-                "name": {"type": "string"},
-                "value": {"type": "integer", "minimum": 100},
-            },
-            "required": ["name", "value"],
-        },
-    }
-    validate_args = {"request": request_obj}
-
-    print(f"Client: Calling data-processor.validate_schema with args: {validate_args}")
+    print(
+        f"Client: Calling data-processor.validate_schema with args: {VALIDATE_SCHEMA_ARGS}"
+    )
     try:
         validate_resp = await session.call_tool(
-            "data-processor.validate_schema", arguments=validate_args
+            "data-processor.validate_schema", arguments=VALIDATE_SCHEMA_ARGS
         )
         print(f"Client: validate_schema response: {validate_resp.content}")
         assert not validate_resp.isError, "Call returned an error"
         # Check response content for valid=True
-        import json
-
         validate_result_dict = json.loads(validate_resp.content[0].text)
         assert (
             validate_result_dict.get("valid") is True
@@ -128,15 +141,14 @@ async def test_tool_calls_valid(session: ClientSession):
 async def test_tool_calls_invalid(session: ClientSession):
     print("\nClient: Testing invalid tool calls (expecting errors)...")
     # Test process_data with missing required field ('data')
-    invalid_args = {"parameters": {}}
     print(
-        f"Client: Calling data-processor.process_data with invalid args: {invalid_args}"
+        f"Client: Calling data-processor.process_data with invalid args: {INVALID_PROCESS_DATA_ARGS}"
     )
 
     # In FastMCP's implementation, validation errors return isError=False but with an error message
     # containing validation error details, rather than raising McpError exceptions
     resp = await session.call_tool(
-        "data-processor.process_data", arguments=invalid_args
+        "data-processor.process_data", arguments=INVALID_PROCESS_DATA_ARGS
     )
     print(f"Client: Response: {resp.content}")
 
@@ -156,11 +168,12 @@ async def test_tool_calls_invalid(session: ClientSession):
 async def test_tool_context(session: ClientSession):
     print("\nClient: Testing tool context usage (check server stderr)...")
     # Call a tool known to use ctx.info/report_progress (e.g., process_data)
-    process_args = {"data": {"data": [{"id": "ctx_test", "value": 1}]}}
     print(
-        f"Client: Calling data-processor.process_data (for context check) with args: {process_args}"
+        f"Client: Calling data-processor.process_data (for context check) with args: {CONTEXT_PROCESS_DATA_ARGS}"
+    )
+    await session.call_tool(
+        "data-processor.process_data", arguments=CONTEXT_PROCESS_DATA_ARGS
     )
-    await session.call_tool("data-processor.process_data", arguments=process_args)
     print(
         "Client: Call complete. Manually check server's stderr output for '[DataProcessorGroup] Processing...' logs and progress reports."
     )
@@ -173,11 +186,10 @@ async def test_tool_error_handling(session: ClientSession):
 
     # Test with our new test_error operation
     tool_name_to_test = "data-processor.test_error"
-    error_args = {"request": {"error_type": "value_error"}}
-    print(f"Client: Calling {tool_name_to_test} with args: {error_args}")
+    print(f"Client: Calling {tool_name_to_test} with args: {TEST_ERROR_ARGS}")
 
     try:
-        resp = await session.call_tool(tool_name_to_test, arguments=error_args)
+        resp = await session.call_tool(tool_name_to_test, arguments=TEST_ERROR_ARGS)
         print(f"Client: {tool_name_to_test} response content: {resp.content}")
 
         # In FastMCP, errors from operation methods are returned as text responses
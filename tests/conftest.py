@@ -94,9 +94,9 @@ def service_config(good_group_config, bad_group_config):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_group_config():
-    """Sample group configuration dictionary."""
+    """Sample group configuration dictionary (shared; do not mutate)."""
     return {
         "name": "test_group",
         "class_path": "tests.dummies:GoodGroup",
@@ -107,9 +107,9 @@ def sample_group_config():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_service_config():
-    """Sample service configuration dictionary."""
+    """Sample service configuration dictionary (shared; do not mutate)."""
     return {
         "name": "test_service",
         "description": "Test service description",
@@ -149,30 +149,35 @@ def sample_config_data():
     }
 
 
-@pytest.fixture
-def group_config_file(temp_dir, sample_group_config):
+@pytest.fixture(scope="session")
+def config_files_dir(session_tmp_dir) -> Path:
+    """Session directory for read-only config files shared across tests."""
+    config_dir = session_tmp_dir / "config"
+    config_dir.mkdir()
+    return config_dir
+
+
+@pytest.fixture(scope="session")
+def group_config_file(config_files_dir, sample_group_config):
     """Create a temporary YAML file with group configuration."""
-    config_file = temp_dir / "test_group_config.yaml"
-    with open(config_file, "w") as f:
-        yaml.dump(sample_group_config, f)
+    config_file = config_files_dir / "test_group_config.yaml"
+    config_file.write_text(yaml.safe_dump(sample_group_config))
     return config_file
 
 
-@pytest.fixture
-def group_config_json_file(temp_dir, sample_group_config):
+@pytest.fixture(scope="session")
+def group_config_json_file(config_files_dir, sample_group_config):
     """Create a temporary JSON file with group configuration."""
-    config_file = temp_dir / "test_group_config.json"
-    with open(config_file, "w") as f:
-        json.dump(sample_group_config, f, indent=2)
+    config_file = config_files_dir / "test_group_config.json"
+    config_file.write_text(json.dumps(sample_group_config, indent=2))
     return config_file
 
 
-@pytest.fixture
-def service_config_file(temp_dir, sample_service_config):
+@pytest.fixture(scope="session")
+def service_config_file(config_files_dir, sample_service_config):
     """Create a temporary YAML file with service configuration."""
-    config_file = temp_dir / "test_service_config.yaml"
-    with open(config_file, "w") as f:
-        yaml.dump(sample_service_config, f)
+    config_file = config_files_dir / "test_service_config.yaml"
+    config_file.write_text(yaml.safe_dump(sample_service_config))
     return config_file
 
 
@@ -183,12 +188,10 @@ def temp_config_file(tmp_path):
     def _create_config(config_data: Dict[str, Any], format: str = "yaml"):
         if format == "yaml":
             config_file = tmp_path / "test_config.yaml"
-            with open(config_file, "w") as f:
-                yaml.dump(config_data, f)
+            config_file.write_text(yaml.safe_dump(config_data))
         else:  # json
             config_file = tmp_path / "test_config.json"
-            with open(config_file, "w") as f:
-                json.dump(config_data, f, indent=2)
+            config_file.write_text(json.dumps(config_data, indent=2))
         return config_file
 
     return _create_config
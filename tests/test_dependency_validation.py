@@ -3,8 +3,6 @@
 import asyncio
 from unittest.mock import AsyncMock
 
-import pytest
-
 from khivemcp.types import DependencyCheck, DependencyStatus, Readiness, ServiceGroup
 
 
@@ -84,7 +82,6 @@ class MockFailingServiceGroup(ServiceGroup):
 class TestDependencyValidation:
     """Test dependency validation functionality."""
 
-    @pytest.mark.asyncio
     async def test_healthy_dependencies(self):
         """Test service group with all healthy dependencies."""
         group = MockTestServiceGroup()
@@ -123,7 +120,6 @@ class TestDependencyValidation:
         assert readiness.details["optional_dependencies"] == 2
         assert readiness.details["healthy_dependencies"] == 3
 
-    @pytest.mark.asyncio
     async def test_failing_dependencies(self):
         """Test service group with failing dependencies."""
         group = MockFailingServiceGroup()
@@ -149,7 +145,6 @@ class TestDependencyValidation:
         assert len(readiness.healthy_dependencies) == 0
         assert len(readiness.unhealthy_dependencies) == 2
 
-    @pytest.mark.asyncio
     async def test_degraded_status(self):
         """Test service group with optional dependency failures (degraded)."""
         group = MockTestServiceGroup()
@@ -180,7 +175,6 @@ class TestDependencyValidation:
         assert len(readiness.healthy_dependencies) == 2
         assert len(readiness.unhealthy_dependencies) == 1
 
-    @pytest.mark.asyncio
     async def test_no_dependencies(self):
         """Test service group with no dependencies."""
         group = ServiceGroup()
@@ -241,7 +235,6 @@ class TestDependencyValidation:
         assert check.required is True
         assert check.details["endpoint"] == "http://api.example.com/health"
 
-    @pytest.mark.asyncio
     async def test_dependency_timeout_handling(self):
         """Test that dependency timeouts are handled correctly."""
         group = ServiceGroup()
@@ -267,7 +260,6 @@ class TestDependencyValidation:
         assert "Timeout after 100ms" in slow_dep.error
         assert slow_dep.response_time_ms >= 100  # Should be close to timeout value
 
-    @pytest.mark.asyncio
     async def test_concurrent_dependency_checks(self):
         """Test that dependency checks run concurrently."""
         group = ServiceGroup()
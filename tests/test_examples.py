@@ -0,0 +1,145 @@
+"""Tests for the example service groups."""
+
+import pytest
+
+from examples.groups.data_processor_group import (
+    DataProcessorGroup,
+    SchemaValidationRequestSchema,
+)
+
+
+async def _validation_errors(group, data, schema):
+    """Run validate_schema and return its errors as (path, message) pairs."""
+    request = SchemaValidationRequestSchema(data=data, schema=schema)
+    result = await group.validate_schema(request=request)
+    assert result.valid is (result.errors is None)
+    return [(error.path, error.message) for error in result.errors or ()]
+
+
+class TestDataProcessorSchemaValidation:
+    """Test validate_schema on the data processor example group."""
+
+    @pytest.fixture
+    def group(self):
+        return DataProcessorGroup()
+
+    async def test_infinite_minimum_is_enforced(self, group):
+        """Should reject values below an infinite minimum bound."""
+        request = SchemaValidationRequestSchema.model_validate_json(
+            '{"data": 5, "schema": {"type": "number", "minimum": Infinity}}'
+        )
+
+        result = await group.validate_schema(request=request)
+
+        assert result.valid is False
+        assert result.errors[0].message == "Value 5 is less than minimum inf"
+
+    async def test_nested_negative_infinite_maximum_is_enforced(self, group):
+        """Should reject nested values above a -inf maximum bound."""
+        request = SchemaValidationRequestSchema(
+            data={"x": 1},
+            schema={
+                "type": "object",
+                "properties": {"x": {"type": "integer", "maximum": float("-inf")}},
+            },
+        )
+
+        result = await group.validate_schema(request=request)
+
+        assert result.valid is False
+        assert result.errors[0].path == "x"
+
+    async def test_infinite_and_missing_bounds_do_not_share_a_plan(self, group):
+        """Should compile separate plans for an inf bound and no bound."""
+        unbounded = SchemaValidationRequestSchema(
+            data=5, schema={"type": "number", "minimum": None}
+        )
+        bounded = SchemaValidationRequestSchema(
+            data=5, schema={"type": "number", "minimum": float("inf")}
+        )
+
+        assert (await group.validate_schema(request=unbounded)).valid is True
+        assert (await group.validate_schema(request=bounded)).valid is False
+
+    async def test_valid_data_has_no_errors(self, group):
+        """Should accept data that satisfies every constraint."""
+        schema = {
+            "type": "object",
+            "required": ["name"],
+            "properties": {"name": {"type": "string", "pattern": "[a-z]+"}},
+        }
+
+        assert await _validation_errors(group, {"name": "abc"}, schema) == []
+
+    async def test_invalid_property_schema_is_reported_on_its_path(self, group):
+        """Should report an invalid nested property schema on that property."""
+        schema = {"type": "object", "properties": {"p": {"nottype": "x"}}}
+
+        errors = await _validation_errors(group, {"p": 1}, schema)
+
+        assert len(errors) == 1
+        path, message = errors[0]
+        assert path == "p"
+        assert message.startswith("Error validating property 'p': ")
+
+    async def test_invalid_items_schema_is_reported_on_the_array(self, group):
+        """Should report an invalid array items schema on the array itself."""
+        errors = await _validation_errors(
+            group, [1], {"type": "array", "items": {"foo": 1}}
+        )
+
+        assert len(errors) == 1
+        path, message = errors[0]
+        assert path == "$"
+        assert message.startswith("Error validating array items: ")
+
+    async def test_missing_required_properties(self, group):
+        """Should report each missing required property at the object path."""
+        errors = await _validation_errors(
+            group, {}, {"type": "object", "required": ["a", "b"]}
+        )
+
+        assert errors == [
+            ("$", "Required property 'a' missing"),
+            ("$", "Required property 'b' missing"),
+        ]
+
+    async def test_pattern_and_email_failures(self, group):
+        """Should report pattern mismatches and malformed emails."""
+        schema = {
+            "type": "object",
+            "properties": {
+                "s": {"type": "string", "pattern": "[a-z]+"},
+                "e": {"type": "string", "format": "email"},
+            },
+        }
+
+        errors = await _validation_errors(group, {"s": "ABC", "e": "x@y"}, schema)
+
+        assert errors == [
+            ("s", "Value does not match pattern: [a-z]+"),
+            ("e", "Invalid email format"),
+        ]
+
+    async def test_nested_object_and_array_paths(self, group):
+        """Should build dotted paths for objects and indexed paths for arrays."""
+        nested = {
+            "type": "object",
+            "properties": {
+                "a": {"type": "object", "properties": {"b": {"type": "integer"}}}
+            },
+        }
+        array = {"type": "array", "items": {"type": "integer"}}
+
+        assert await _validation_errors(group, {"a": {"b": "x"}}, nested) == [
+            ("a.b", "Expected type 'integer', got str")
+        ]
+        assert await _validation_errors(group, [1, "x"], array) == [
+            ("[1]", "Expected type 'integer', got str")
+        ]
+
+    async def test_unknown_type_is_reported(self, group):
+        """Should reject data for a schema type the validator does not know."""
+        errors = await _validation_errors(group, 1, {"type": "weird"})
+
+        assert errors == [("$", "Expected type 'weird', got int")]
@@ -2,7 +2,6 @@
 
 import asyncio
 
-import pytest
 from pydantic import BaseModel
 
 from khivemcp.tool_spec import ToolSpec
@@ -108,7 +107,6 @@ class TestSchemaCoercionPerformance:
 class TestConcurrencyPerformance:
     """Test concurrent operation performance."""
 
-    @pytest.mark.asyncio
     async def test_concurrent_schema_coercion(self):
         """Test that concurrent schema coercion performs well."""
         wrapper = create_tool_wrapper(
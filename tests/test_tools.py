@@ -1,22 +1,47 @@
 """Unit tests for tool wrapper creation and RBAC enforcement."""
 
 import asyncio
-from types import SimpleNamespace
+import sys
 
 import pytest
 from pydantic import BaseModel, ValidationError
 
 from khivemcp.tool_spec import ToolSpec
-from khivemcp.tools import create_tool_wrapper
+from khivemcp.tools import _get_adapter, create_tool_wrapper
 from tests.dummies import ComplexRequest, GoodGroup, SimpleRequest
 
+# GoodGroup operations are stateless, so one instance serves every test
+_GROUP = GoodGroup()
+
+
+class _Token:
+    """Minimal access token stand-in."""
+
+    __slots__ = ("scopes", "sub", "exp", "iat", "iss")
+
+    def __init__(self, scopes, sub, exp, iat, iss):
+        self.scopes = scopes
+        self.sub = sub
+        self.exp = exp
+        self.iat = iat
+        self.iss = iss
+
+
+class _Ctx:
+    """Minimal FastMCP Context stand-in carrying only an access token."""
+
+    __slots__ = ("access_token",)
+
+    def __init__(self, access_token=None):
+        self.access_token = access_token
+
 
 class TestToolWrapper:
     """Test tool wrapper creation and validation."""
 
     def mk_spec(self, accepts_ctx=False, auth=None, schema=SimpleRequest):
         """Helper to create ToolSpec instances."""
-        group = GoodGroup()
+        group = _GROUP
 
         # Choose correct method based on schema and context requirements
         if accepts_ctx:
@@ -43,41 +68,45 @@ class TestToolWrapper:
         else:
             return await wrapper(request=payload)
 
-    def test_schema_coercion_dict_and_str(self):
-        """Test that dict and JSON string payloads are properly validated."""
+    async def test_schema_coercion_dict_and_str(self):
+        """Test that dict and JSON string/bytes payloads are properly validated."""
         wrapper = create_tool_wrapper(self.mk_spec())
 
         # Test with dict payload
-        result = asyncio.run(self.run_wrapper(wrapper, {"value": 3}))
+        result = await self.run_wrapper(wrapper, {"value": 3})
         assert result["result"] == 6  # GoodGroup.open_operation multiplies by 2
 
         # Test with JSON string payload
-        result = asyncio.run(self.run_wrapper(wrapper, '{"value": 4}'))
+        result = await self.run_wrapper(wrapper, '{"value": 4}')
         assert result["result"] == 8
 
-    def test_schema_validation_with_type_adapter(self):
+        # Test with raw JSON bytes payload
+        result = await self.run_wrapper(wrapper, b'{"value": 5}')
+        assert result["result"] == 10
+
+    async def test_schema_validation_with_type_adapter(self):
         """Test that TypeAdapter provides fast validation."""
         wrapper = create_tool_wrapper(self.mk_spec(schema=ComplexRequest))
 
         # Valid complex request
         payload = {"data": {"key": "value"}, "count": 3}
-        result = asyncio.run(self.run_wrapper(wrapper, payload))
+        result = await self.run_wrapper(wrapper, payload)
         assert result["processed"] == {"key": "value"}
         assert result["multiplied_count"] == 3
 
-    def test_schema_invalid_raises_error(self):
+    async def test_schema_invalid_raises_error(self):
         """Test that invalid payloads raise proper validation errors."""
         wrapper = create_tool_wrapper(self.mk_spec())
 
         # Invalid payload (missing required field)
-        with pytest.raises(ValueError, match="Invalid request format"):
-            asyncio.run(self.run_wrapper(wrapper, {"wrong_field": "oops"}))
+        with pytest.raises(ValidationError):
+            await self.run_wrapper(wrapper, {"wrong_field": "oops"})
 
         # Invalid JSON string
-        with pytest.raises(ValueError, match="Invalid request format"):
-            asyncio.run(self.run_wrapper(wrapper, '{"value": "not_a_number"}'))
+        with pytest.raises(ValidationError):
+            await self.run_wrapper(wrapper, '{"value": "not_a_number"}')
 
-    def test_no_schema_passes_through(self):
+    async def test_no_schema_passes_through(self):
         """Test that operations without schema pass requests unchanged."""
 
         # Create async function for testing
@@ -97,7 +126,7 @@ class TestToolWrapper:
         wrapper = create_tool_wrapper(spec)
 
         # Any payload should pass through unchanged
-        result = asyncio.run(self.run_wrapper(wrapper, {"anything": "goes"}))
+        result = await self.run_wrapper(wrapper, {"anything": "goes"})
         assert "anything" in result["received"]
 
 
@@ -106,7 +135,7 @@ class TestRBACEnforcement:
 
     def mk_token(self, scopes=None, sub="test_user"):
         """Create a mock access token."""
-        return SimpleNamespace(
+        return _Token(
             scopes=scopes or [],
             sub=sub,
             exp=9999999999,
@@ -114,16 +143,13 @@ class TestRBACEnforcement:
             iss="test_issuer",
         )
 
-    def mk_context(self, token=None, **kwargs):
+    def mk_context(self, token=None):
         """Create a mock FastMCP Context."""
-        ctx = SimpleNamespace(**kwargs)
-        if token:
-            ctx.access_token = token
-        return ctx
+        return _Ctx(access_token=token)
 
     def mk_spec_with_auth(self, auth_required, accepts_ctx=False):
         """Create ToolSpec with auth requirements."""
-        group = GoodGroup()
+        group = _GROUP
         method = group.secure_operation if accepts_ctx else group.open_operation
         return ToolSpec(
             group_name="secure_group",
@@ -135,12 +161,12 @@ class TestRBACEnforcement:
             auth_required=auth_required,
         )
 
-    def test_no_auth_required_allows_access(self):
+    async def test_no_auth_required_allows_access(self):
         """Test that operations without auth requirements work normally."""
         spec = ToolSpec(
             group_name="open",
             full_tool_name="open_op",
-            bound_method=GoodGroup().open_operation,
+            bound_method=_GROUP.open_operation,
             schema_cls=SimpleRequest,
             accepts_ctx=False,
             description="Open operation",
@@ -149,10 +175,10 @@ class TestRBACEnforcement:
         wrapper = create_tool_wrapper(spec)
 
         # Should work without any context
-        result = asyncio.run(wrapper(request={"value": 5}))
+        result = await wrapper(request={"value": 5})
         assert result["result"] == 10
 
-    def test_auth_required_denies_without_context(self):
+    async def test_auth_required_denies_without_context(self):
         """Test that auth-required operations deny access without context."""
         spec = self.mk_spec_with_auth(auth_required=["write"])
         wrapper = create_tool_wrapper(spec)
@@ -160,9 +186,9 @@ class TestRBACEnforcement:
         # Should require context for auth operations (wrapper signature changes)
         # This should fail due to missing ctx parameter
         with pytest.raises(TypeError):
-            asyncio.run(wrapper(request={"value": 5}))
+            await wrapper(request={"value": 5})
 
-    def test_auth_required_denies_without_token(self):
+    async def test_auth_required_denies_without_token(self):
         """Test that auth-required operations deny access without token."""
         spec = self.mk_spec_with_auth(auth_required=["write"])
         wrapper = create_tool_wrapper(spec)
@@ -170,9 +196,13 @@ class TestRBACEnforcement:
         # Context without token should be denied
         ctx = self.mk_context()  # No token
         with pytest.raises(PermissionError, match="Authentication required"):
-            asyncio.run(wrapper(ctx=ctx, request={"value": 5}))
+            await wrapper(ctx=ctx, request={"value": 5})
+
+        # A missing context is treated the same as a context without a token
+        with pytest.raises(PermissionError, match="Authentication required"):
+            await wrapper(ctx=None, request={"value": 5})
 
-    def test_auth_required_denies_insufficient_scopes(self):
+    async def test_auth_required_denies_insufficient_scopes(self):
         """Test that operations deny access when token lacks required scopes."""
         spec = self.mk_spec_with_auth(auth_required=["write", "admin"])
         wrapper = create_tool_wrapper(spec)
@@ -182,9 +212,9 @@ class TestRBACEnforcement:
         ctx = self.mk_context(token=token)
 
         with pytest.raises(PermissionError, match="Missing required scopes"):
-            asyncio.run(wrapper(ctx=ctx, request={"value": 5}))
+            await wrapper(ctx=ctx, request={"value": 5})
 
-    def test_auth_required_allows_sufficient_scopes(self):
+    async def test_auth_required_allows_sufficient_scopes(self):
         """Test that operations allow access when token has required scopes."""
         spec = self.mk_spec_with_auth(auth_required=["read"], accepts_ctx=False)
         wrapper = create_tool_wrapper(spec)
@@ -194,10 +224,10 @@ class TestRBACEnforcement:
         ctx = self.mk_context(token=token)
 
         # Should succeed
-        result = asyncio.run(wrapper(ctx=ctx, request={"value": 5}))
+        result = await wrapper(ctx=ctx, request={"value": 5})
         assert result["result"] == 10
 
-    def test_auth_with_context_method_passes_context(self):
+    async def test_auth_with_context_method_passes_context(self):
         """Test that auth-required methods that accept context receive it properly."""
         spec = self.mk_spec_with_auth(auth_required=["write"], accepts_ctx=True)
         wrapper = create_tool_wrapper(spec)
@@ -207,11 +237,11 @@ class TestRBACEnforcement:
         ctx = self.mk_context(token=token)
 
         # Should succeed and pass context to underlying method
-        result = asyncio.run(wrapper(ctx=ctx, request={"value": 5}))
+        result = await wrapper(ctx=ctx, request={"value": 5})
         assert result["result"] == 15  # secure_operation multiplies by 3
         assert "user" in result  # secure_operation includes user info from context
 
-    def test_auth_without_context_method_works(self):
+    async def test_auth_without_context_method_works(self):
         """Test that auth wrapper works for methods that don't accept context."""
         spec = self.mk_spec_with_auth(auth_required=["read"], accepts_ctx=False)
         wrapper = create_tool_wrapper(spec)
@@ -220,10 +250,10 @@ class TestRBACEnforcement:
         ctx = self.mk_context(token=token)
 
         # Should work even though underlying method doesn't take ctx
-        result = asyncio.run(wrapper(ctx=ctx, request={"value": 7}))
+        result = await wrapper(ctx=ctx, request={"value": 7})
         assert result["result"] == 14  # open_operation multiplies by 2
 
-    def test_multiple_scope_requirements(self):
+    async def test_multiple_scope_requirements(self):
         """Test operations requiring multiple scopes."""
         spec = self.mk_spec_with_auth(auth_required=["read", "write", "admin"])
         wrapper = create_tool_wrapper(spec)
@@ -232,7 +262,7 @@ class TestRBACEnforcement:
         token = self.mk_token(scopes=["read", "write", "admin", "extra"])
         ctx = self.mk_context(token=token)
 
-        result = asyncio.run(wrapper(ctx=ctx, request={"value": 3}))
+        result = await wrapper(ctx=ctx, request={"value": 3})
         assert result["result"] == 6
 
         # Token missing one scope
@@ -240,7 +270,17 @@ class TestRBACEnforcement:
         ctx_insufficient = self.mk_context(token=token_insufficient)
 
         with pytest.raises(PermissionError, match="Missing required scopes"):
-            asyncio.run(wrapper(ctx=ctx_insufficient, request={"value": 3}))
+            await wrapper(ctx=ctx_insufficient, request={"value": 3})
+
+    def test_auth_required_scopes_are_interned(self):
+        """Test that ToolSpec interns required scopes at construction."""
+        # Built at runtime so the literal isn't already interned by the compiler
+        admin = "".join(["ad", "min"])
+        assert admin is not sys.intern("admin")
+        spec = self.mk_spec_with_auth(auth_required=["write", admin, "read"])
+
+        assert spec.auth_required == ["write", "admin", "read"]
+        assert spec.auth_required[1] is sys.intern("admin")
 
     def test_wrapper_function_metadata(self):
         """Test that wrapper functions have proper metadata set."""
@@ -251,17 +291,20 @@ class TestRBACEnforcement:
         assert wrapper.__qualname__ == "secure_operation"
         assert wrapper.__doc__ == "Secure operation"
 
-    def test_performance_type_adapter_reuse(self):
-        """Test that TypeAdapter is cached for performance."""
+    async def test_performance_type_adapter_reuse(self):
+        """Test that wrappers for the same schema share one cached TypeAdapter."""
+        _get_adapter.cache_clear()
         spec = self.mk_spec_with_auth(auth_required=None, accepts_ctx=False)
         wrapper = create_tool_wrapper(spec)
+        other_wrapper = create_tool_wrapper(spec)
 
-        # Multiple calls should reuse the same TypeAdapter
-        payload1 = {"value": 1}
-        payload2 = {"value": 2}
+        cache_info = _get_adapter.cache_info()
+        assert (cache_info.misses, cache_info.hits) == (1, 1)
 
-        result1 = asyncio.run(wrapper(request=payload1))
-        result2 = asyncio.run(wrapper(request=payload2))
+        # Concurrent calls, as MCP dispatches them, share the same TypeAdapter
+        result1, result2 = await asyncio.gather(
+            wrapper(request={"value": 1}), other_wrapper(request={"value": 2})
+        )
 
         assert result1["result"] == 2
         assert result2["result"] == 4
@@ -1,17 +1,21 @@
 """Tests for khivemcp.types module."""
 
 import pytest
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from khivemcp.types import GroupConfig, ServiceConfig, ServiceGroup
 
+# Built once per module; dict-driven tests validate through these adapters
+_GROUP_TA = TypeAdapter(GroupConfig)
+_SERVICE_TA = TypeAdapter(ServiceConfig)
+
 
 class TestGroupConfig:
     """Tests for the GroupConfig class."""
 
     def test_create_valid_group_config(self, sample_group_config):
         """Should create a valid GroupConfig instance."""
-        group_config = GroupConfig(**sample_group_config)
+        group_config = _GROUP_TA.validate_python(sample_group_config)
         assert group_config.name == "test_group"
         assert group_config.class_path == "tests.dummies:GoodGroup"
         assert group_config.description == "Test group description"
@@ -25,7 +29,7 @@ class TestGroupConfig:
             "name": "minimal_group",
             "class_path": "module.path:MinimalClass",
         }
-        group_config = GroupConfig(**minimal_config)
+        group_config = _GROUP_TA.validate_python(minimal_config)
         assert group_config.name == "minimal_group"
         assert group_config.class_path == "module.path:MinimalClass"
         assert group_config.description is None
@@ -47,6 +51,10 @@ class TestGroupConfig:
         with pytest.raises(ValueError, match="class_path must be in the format"):
             GroupConfig(name="test", class_path="module:path.TestClass")
 
+        # Empty class name
+        with pytest.raises(ValueError, match="class_path must be in the format"):
+            GroupConfig(name="test", class_path="module.path:")
+
     def test_missing_required_fields(self):
         """Should raise ValidationError when required fields are missing."""
         # Missing name
@@ -63,7 +71,7 @@ class TestServiceConfig:
 
     def test_create_valid_service_config(self, sample_service_config):
         """Should create a valid ServiceConfig instance."""
-        service_config = ServiceConfig(**sample_service_config)
+        service_config = _SERVICE_TA.validate_python(sample_service_config)
         assert service_config.name == "test_service"
         assert service_config.description == "Test service description"
         assert len(service_config.groups) == 2
@@ -85,7 +93,7 @@ class TestServiceConfig:
                 }
             },
         }
-        service_config = ServiceConfig(**minimal_config)
+        service_config = _SERVICE_TA.validate_python(minimal_config)
         assert service_config.name == "minimal_service"
         assert service_config.description is None
         assert len(service_config.groups) == 1
@@ -54,8 +54,9 @@ class TestLoadConfig:
     def test_invalid_yaml_content(self, temp_dir):
         """Should raise ValueError for invalid YAML content."""
         invalid_yaml_file = temp_dir / "invalid.yaml"
-        with open(invalid_yaml_file, "w") as f:
-            f.write("invalid: yaml: content:\n  - missing: colon\n    indentation")
+        invalid_yaml_file.write_text(
+            "invalid: yaml: content:\n  - missing: colon\n    indentation"
+        )
 
         with pytest.raises(ValueError, match="Invalid file format"):
             load_config(invalid_yaml_file)
@@ -63,8 +64,7 @@ class TestLoadConfig:
     def test_invalid_json_content(self, temp_dir):
         """Should raise ValueError for invalid JSON content."""
         invalid_json_file = temp_dir / "invalid.json"
-        with open(invalid_json_file, "w") as f:
-            f.write("{invalid json}")
+        invalid_json_file.write_text("{invalid json}")
 
         with pytest.raises(ValueError, match="Invalid file format"):
             load_config(invalid_json_file)
@@ -72,8 +72,8 @@ class TestLoadConfig:
     def test_yaml_not_dict(self, temp_dir):
         """Should raise ValueError when YAML content is not a dictionary."""
         not_dict_file = temp_dir / "not_dict.yaml"
-        with open(not_dict_file, "w") as f:
-            yaml.dump(["item1", "item2"], f)  # List instead of dict
+        # List instead of dict
+        not_dict_file.write_text(yaml.safe_dump(["item1", "item2"]))
 
         with pytest.raises(ValueError, match="does not resolve to a dictionary"):
             load_config(not_dict_file)
@@ -81,8 +81,7 @@ class TestLoadConfig:
     def test_json_not_dict(self, temp_dir):
         """Should raise ValueError when JSON content is not an object."""
         not_dict_file = temp_dir / "not_dict.json"
-        with open(not_dict_file, "w") as f:
-            json.dump(["item1", "item2"], f)  # Array instead of object
+        not_dict_file.write_text(json.dumps(["item1", "item2"]))  # Array, not object
 
         with pytest.raises(ValueError, match="does not resolve to an object"):
             load_config(not_dict_file)
@@ -90,8 +89,8 @@ class TestLoadConfig:
     def test_group_config_missing_class_path(self, temp_dir):
         """Should raise ValueError when GroupConfig is missing class_path."""
         invalid_config_file = temp_dir / "invalid_group.yaml"
-        with open(invalid_config_file, "w") as f:
-            yaml.dump({"name": "test_group"}, f)  # Missing class_path
+        # Missing class_path
+        invalid_config_file.write_text(yaml.safe_dump({"name": "test_group"}))
 
         with pytest.raises(ValueError, match="missing the required 'class_path'"):
             load_config(invalid_config_file)
@@ -99,9 +98,10 @@ class TestLoadConfig:
     def test_validation_error_propagation(self, temp_dir):
         """Should propagate validation errors from Pydantic."""
         invalid_config_file = temp_dir / "validation_error.yaml"
-        with open(invalid_config_file, "w") as f:
-            # Missing required 'name' field
-            yaml.dump({"class_path": "module.path:TestClass"}, f)
+        # Missing required 'name' field
+        invalid_config_file.write_text(
+            yaml.safe_dump({"class_path": "module.path:TestClass"})
+        )
 
         with pytest.raises(ValueError, match="Configuration validation failed"):
             load_config(invalid_config_file)